@@ -22,7 +22,7 @@ from folium.utilities import (
     validate_location,
 )
 
-ENV = Environment(loader=PackageLoader("folium", "templates"))
+ENV = Environment(loader=PackageLoader("folium", "templates"), auto_reload=False)
 
 
 _default_js = [
@@ -37,6 +37,14 @@ class Layer(MacroElement):
         Whether the layer will be shown on opening.
     """
 
+    _add_to_map_template = Template(
+        """
+        {%- macro script(this, kwargs) %}
+            {{ this.get_name() }}.addTo({{ this._parent.get_name() }});
+        {%- endmacro %}
+        """
+    )
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -57,14 +65,7 @@ class Layer(MacroElement):
 
     def _add_layer_to_map(self, **kwargs):
         """Show the layer on the map by adding it to its parent in JS."""
-        template = Template(
-            """
-            {%- macro script(this, kwargs) %}
-                {{ this.get_name() }}.addTo({{ this._parent.get_name() }});
-            {%- endmacro %}
-            """
-        )
-        script = template.module.__dict__["script"]
+        script = self._add_to_map_template.module.__dict__["script"]
         figure = get_and_assert_figure_root(self)
         figure.script.add_child(
             Element(script(self, kwargs)), name=self.get_name() + "_add"
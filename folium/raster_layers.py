@@ -2,8 +2,19 @@
 Wraps leaflet TileLayer, WmsTileLayer (TileLayer.WMS), ImageOverlay, and VideoOverlay
 
 """
-from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
+import numpy as np
 from branca.element import Element, Figure
 from jinja2 import Environment, PackageLoader, Template
 
@@ -11,16 +22,78 @@ from folium.map import Layer
 from folium.utilities import (
     TypeBounds,
     TypeJsonValue,
+    _validate_colormap,
     image_to_url,
     mercator_transform,
     parse_options,
+    validate_locations,
 )
 
 if TYPE_CHECKING:
     import xyzservices
 
 
-ENV = Environment(loader=PackageLoader("folium", "templates"))
+ENV = Environment(loader=PackageLoader("folium", "templates"), auto_reload=False)
+
+
+def _list_builtin_tilesets() -> FrozenSet[str]:
+    """Return the names of the tilesets that have both a url and an attribution."""
+    templates = set(ENV.list_templates(filter_func=lambda x: x.startswith("tiles/")))
+    return frozenset(
+        name
+        for name in {template.split("/")[1] for template in templates}
+        if "tiles/" + name + "/tiles.txt" in templates
+        and "tiles/" + name + "/attr.txt" in templates
+    )
+
+
+# The built-in tilesets shipped with folium don't change at runtime.
+_BUILTIN_TILESETS = _list_builtin_tilesets()
+
+# Tilesets that needed an API key and whose templates have been removed.
+_REMOVED_TILESETS = frozenset(
+    {"cloudmade", "mapbox", "mapboxbright", "mapboxcontrolroom"}
+)
+
+_PIXELATED_CSS = """
+    <style>
+        .leaflet-image-layer {
+            /* old android/safari*/
+            image-rendering: -webkit-optimize-contrast;
+            image-rendering: crisp-edges; /* safari */
+            image-rendering: pixelated; /* chrome */
+            image-rendering: -moz-crisp-edges; /* firefox */
+            image-rendering: -o-crisp-edges; /* opera */
+            -ms-interpolation-mode: nearest-neighbor; /* ie */
+        }
+    </style>
+"""
+
+
+def _coerce_attr(attr: Union[str, bytes, None]) -> Optional[str]:
+    """Return a tile attribution as text, decoding it if given as bytes."""
+    if isinstance(attr, (bytes, bytearray)):
+        return attr.decode("utf-8")
+    return attr
+
+
+def _validate_bounds(bounds: TypeBounds) -> List[List[float]]:
+    """Validate bounds of the form [[lat_min, lon_min], [lat_max, lon_max]]."""
+    locations = validate_locations(bounds)
+    if len(locations) != 2:
+        raise ValueError(
+            "Expected two (lat, lon) corners for bounds, "
+            "instead got: {!r}.".format(bounds)
+        )
+    return locations
+
+
+@lru_cache(maxsize=64)
+def _render_builtin_tiles(tiles_flat: str) -> Tuple[str, str]:
+    """Render the url and attribution templates of a built-in tileset."""
+    tiles = ENV.get_template("tiles/" + tiles_flat + "/tiles.txt").render()
+    attr = ENV.get_template("tiles/" + tiles_flat + "/attr.txt").render()
+    return tiles, attr
 
 
 class TileLayer(Layer):
@@ -115,34 +188,29 @@ class TileLayer(Layer):
             subdomains = tiles.get("subdomains", subdomains)
             tiles = tiles.build_url(fill_subdomain=False, scale_factor="{r}")  # type: ignore
 
-        self.tile_name = (
-            name if name is not None else "".join(tiles.lower().strip().split())
-        )
+        tiles_flat = "".join(tiles.lower().strip().split())
+        self.tile_name = name if name is not None else tiles_flat
         super().__init__(
             name=self.tile_name, overlay=overlay, control=control, show=show
         )
         self._name = "TileLayer"
         self._env = ENV
 
-        tiles_flat = "".join(tiles.lower().strip().split())
-        if tiles_flat in {"cloudmade", "mapbox", "mapboxbright", "mapboxcontrolroom"}:
+        if tiles_flat in _REMOVED_TILESETS:
             # added in May 2020 after v0.11.0, remove in a future release
             raise ValueError(
                 "Built-in templates for Mapbox and Cloudmade have been removed. "
                 "You can still use these providers by passing a URL to the `tiles` "
                 "argument. See the documentation of the `TileLayer` class."
             )
-        templates = list(
-            self._env.list_templates(filter_func=lambda x: x.startswith("tiles/"))
-        )
-        tile_template = "tiles/" + tiles_flat + "/tiles.txt"
-        attr_template = "tiles/" + tiles_flat + "/attr.txt"
 
-        if tile_template in templates and attr_template in templates:
-            self.tiles = self._env.get_template(tile_template).render()
-            attr = self._env.get_template(attr_template).render()
+        # A url can't be the name of a built-in tileset, skip the lookup.
+        is_url = "{" in tiles_flat or "/" in tiles_flat
+        if not is_url and tiles_flat in _BUILTIN_TILESETS:
+            self.tiles, attr = _render_builtin_tiles(tiles_flat)
         else:
             self.tiles = tiles
+            attr = _coerce_attr(attr)
             if not attr:
                 raise ValueError("Custom tiles must have an attribution.")
 
@@ -232,7 +300,7 @@ class WmsTileLayer(Layer):
             styles=styles,
             transparent=transparent,
             version=version,
-            attribution=attr,
+            attribution=_coerce_attr(attr),
             **kwargs
         )
         if cql_filter:
@@ -315,15 +383,42 @@ class ImageOverlay(Layer):
     ):
         super().__init__(name=name, overlay=overlay, control=control, show=show)
         self._name = "ImageOverlay"
-        self.bounds = bounds
+        self.bounds = _validate_bounds(bounds)
         self.options = parse_options(**kwargs)
         self.pixelated = pixelated
-        if mercator_project:
-            image = mercator_transform(
-                image, (bounds[0][0], bounds[1][0]), origin=origin
+        self._origin = origin
+        self._colormap = colormap
+        self._mercator_project = mercator_project
+        if mercator_project or "ndarray" in image.__class__.__name__:
+            # Projecting and encoding arrays is only done once the url is
+            # needed. Take a copy, so that reusing the same buffer for another
+            # overlay doesn't change this one.
+            self._image: Any = np.array(image, copy=True)
+            _validate_colormap(self._image, colormap)
+            self._url: Optional[str] = None
+        else:
+            self._image = None
+            self._url = image_to_url(image, origin=origin, colormap=colormap)
+
+    @property
+    def url(self) -> str:
+        """Url of the image, converting the image data on first access."""
+        if self._url is None:
+            image = self._image
+            if self._mercator_project:
+                image = mercator_transform(
+                    image, (self.bounds[0][0], self.bounds[1][0]), origin=self._origin
+                )
+            self._url = image_to_url(
+                image, origin=self._origin, colormap=self._colormap
             )
+            self._image = None
+        return self._url
 
-        self.url = image_to_url(image, origin=origin, colormap=colormap)
+    @url.setter
+    def url(self, value: str) -> None:
+        self._url = value
+        self._image = None
 
     def render(self, **kwargs) -> None:
         super().render()
@@ -332,22 +427,9 @@ class ImageOverlay(Layer):
         assert isinstance(
             figure, Figure
         ), "You cannot render this Element if it is not in a Figure."
-        if self.pixelated:
-            pixelated = """
-                <style>
-                    .leaflet-image-layer {
-                        /* old android/safari*/
-                        image-rendering: -webkit-optimize-contrast;
-                        image-rendering: crisp-edges; /* safari */
-                        image-rendering: pixelated; /* chrome */
-                        image-rendering: -moz-crisp-edges; /* firefox */
-                        image-rendering: -o-crisp-edges; /* opera */
-                        -ms-interpolation-mode: nearest-neighbor; /* ie */
-                    }
-                </style>
-            """
+        if self.pixelated and "leaflet-image-layer" not in figure.header._children:
             figure.header.add_child(
-                Element(pixelated), name="leaflet-image-layer"
+                Element(_PIXELATED_CSS), name="leaflet-image-layer"
             )  # noqa
 
     def _get_self_bounds(self) -> TypeBounds:
@@ -414,7 +496,7 @@ class VideoOverlay(Layer):
         self._name = "VideoOverlay"
         self.video_url = video_url
 
-        self.bounds = bounds
+        self.bounds = _validate_bounds(bounds)
         self.options = parse_options(autoplay=autoplay, loop=loop, **kwargs)
 
     def _get_self_bounds(self) -> TypeBounds:
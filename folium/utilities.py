@@ -1,7 +1,6 @@
 import base64
 import collections
 import copy
-import json
 import math
 import os
 import re
@@ -24,6 +23,7 @@ from typing import (
 from urllib.parse import urlparse, uses_netloc, uses_params, uses_relative
 
 import numpy as np
+from branca.colormap import ColorMap
 from branca.element import Element, Figure
 
 # import here for backwards compatibility
@@ -189,13 +189,59 @@ def image_to_url(
         b64encoded = base64.b64encode(img).decode("utf-8")
         url = f"data:image/{fileformat};base64,{b64encoded}"
     elif "ndarray" in image.__class__.__name__:
+        if image.dtype.kind in "biu":
+            # Integer images have few distinct values, colorize them through
+            # a lookup. Float values are nearly all distinct, so sorting them
+            # would cost more than it saves: leave those to write_png.
+            image = _colorize_mono_image(image, colormap)
         img = write_png(image, origin=origin, colormap=colormap)
         b64encoded = base64.b64encode(img).decode("utf-8")
         url = f"data:image/png;base64,{b64encoded}"
     else:
-        # Round-trip to ensure a nice formatted json.
-        url = json.loads(json.dumps(image))
-    return url.replace("\n", " ")
+        # Base64 data urls never contain newlines, only plain urls need this.
+        url = image.replace("\n", " ")
+    return url
+
+
+def _validate_colormap(image: np.ndarray, colormap: Optional[Callable]) -> None:
+    """Check that colormap gives RGB(A) colors for image, on a single pixel."""
+    if image.size:
+        _colorize_mono_image(np.atleast_3d(image)[:1, :1], colormap)
+
+
+def _get_colormap_callable(colormap: Optional[Callable]) -> Callable:
+    """Return the function mapping a mono value to a color."""
+    # Mirrors the colormap dispatch in branca.utilities.write_png, keep the
+    # two in sync so that colorized images don't depend on who colorizes them.
+    if isinstance(colormap, ColorMap):
+        return colormap.rgba_floats_tuple
+    elif callable(colormap):
+        return colormap
+    else:
+        return lambda x: (x, x, x, 1)
+
+
+def _colorize_mono_image(image: np.ndarray, colormap: Optional[Callable]) -> np.ndarray:
+    """
+    Map a mono (NxM) image to RGB(A) colors, leaving other images untouched.
+
+    The colormap is called once per distinct value instead of once per pixel,
+    which for 8-bit data is at most 256 calls whatever the size of the image.
+    The result is the same as letting branca's write_png apply the colormap.
+
+    """
+    array = np.atleast_3d(image)
+    height, width, nblayers = array.shape
+    if nblayers != 1:
+        return image
+
+    colormap_callable = _get_colormap_callable(colormap)
+    values, inverse = np.unique(array, return_inverse=True)
+    colors = np.array([colormap_callable(value) for value in values])
+    if colors.ndim != 2 or colors.shape[1] not in (3, 4):
+        # Same error as branca's write_png.
+        raise ValueError("colormap must provide colors of length 3 (RGB) or 4 (RGBA)")
+    return colors[inverse.reshape(-1)].reshape((height, width, colors.shape[1]))
 
 
 def _is_url(url: str) -> bool:
@@ -242,7 +288,10 @@ def mercator_transform(
     def mercator(x):
         return np.arcsinh(np.tan(x * np.pi / 180.0)) * 180.0 / np.pi
 
-    array = np.atleast_3d(data).copy()
+    def inverse_mercator(y):
+        return np.arctan(np.sinh(y * np.pi / 180.0)) * 180.0 / np.pi
+
+    array = np.atleast_3d(data)
     height, width, nblayers = array.shape
 
     lat_min = max(lat_bounds[0], -85.051128779806589)
@@ -261,10 +310,36 @@ def mercator_transform(
         0.5 / height_out, 1.0 - 0.5 / height_out, height_out
     ) * (mercator(lat_max) - mercator(lat_min))
 
-    out = np.zeros((height_out, width, nblayers))
-    for i in range(width):
-        for j in range(nblayers):
-            out[:, i, j] = np.interp(latslats, mercator(lats), array[:, i, j])
+    # Linear interpolation along the latitude axis, for all columns and
+    # layers at once (same result as np.interp, including edge clamping).
+    # The input rows are evenly spaced in latitude, so the row below each
+    # output row is found directly from its latitude instead of searching.
+    mercator_lats = mercator(lats)
+    if height > 1 and lat_max != lat_min:
+        rows = (inverse_mercator(latslats) - lat_min) / (lat_max - lat_min)
+        upper = np.clip(np.floor(rows * height - 0.5).astype(int) + 1, 1, height - 1)
+        lower = upper - 1
+        weights = (latslats - mercator_lats[lower]) / (
+            mercator_lats[upper] - mercator_lats[lower]
+        )
+        weights = np.clip(weights, 0.0, 1.0)
+        # Blend exact and clamped rows with themselves, so that a NaN (no data)
+        # in a neighbouring row isn't pulled in with a zero weight.
+        lower, upper = (
+            np.where(weights == 1.0, upper, lower),
+            np.where(weights == 0.0, lower, upper),
+        )
+        weights = weights[:, np.newaxis, np.newaxis]
+        # Blend in place, the gathered rows are already fresh copies.
+        out = array[lower].astype(float, copy=False)
+        out *= 1.0 - weights
+        upper_rows = array[upper].astype(float, copy=False)
+        upper_rows *= weights
+        out += upper_rows
+    else:
+        # A single row, or a zero-height span where all rows share the same
+        # latitude: np.interp takes the last row.
+        out = np.repeat(array[-1:].astype(float), height_out, axis=0)
 
     # Eventually flip the image.
     if origin == "upper":
@@ -3,6 +3,8 @@ Test raster_layers
 ------------------
 
 """
+import numpy as np
+import pytest
 import xyzservices
 from jinja2 import Template
 
@@ -49,6 +51,14 @@ def test_custom_tile_subdomains():
     assert "mytilesubdomain" in out
 
 
+def test_tile_layer_bytes_attribution():
+    url = "http://{s}.custom_tiles.org/{z}/{x}/{y}.png"
+    m = folium.Map(tiles=None)
+    folium.TileLayer(tiles=url, attr="© attribution".encode("utf-8")).add_to(m)
+    out = m._parent.render()
+    assert '"attribution": "\\u00a9 attribution"' in out
+
+
 def test_wms():
     m = folium.Map([40, -100], zoom_start=4)
     url = "http://mesonet.agron.iastate.edu/cgi-bin/wms/nexrad/n0r.cgi"
@@ -113,6 +123,83 @@ def test_image_overlay():
     assert bounds == [[0, -180], [90, 180]], bounds
 
 
+def test_image_overlay_is_encoded_lazily(monkeypatch):
+    calls = []
+
+    def fake_image_to_url(image, **kwargs):
+        calls.append(image)
+        return "data:image/png;base64,"
+
+    monkeypatch.setattr(folium.raster_layers, "image_to_url", fake_image_to_url)
+    io = folium.raster_layers.ImageOverlay(np.zeros((2, 2)), [[0, 0], [1, 1]])
+    assert calls == []
+
+    m = folium.Map()
+    io.add_to(m)
+    m.get_root().render()
+    m.get_root().render()
+    assert len(calls) == 1
+
+
+def test_image_overlay_copies_array():
+    buffer = np.zeros((3, 3))
+    bounds = [[0, 0], [1, 1]]
+    first = folium.raster_layers.ImageOverlay(buffer, bounds)
+    buffer[:] = 1.0
+    second = folium.raster_layers.ImageOverlay(buffer, bounds)
+    assert first.url != second.url
+
+
+def test_image_overlay_reads_file_at_construction(tmp_path):
+    path = tmp_path / "frame.png"
+    bounds = [[0, 0], [1, 1]]
+    path.write_bytes(b"first frame")
+    first = folium.raster_layers.ImageOverlay(str(path), bounds)
+    path.write_bytes(b"second frame")
+    second = folium.raster_layers.ImageOverlay(str(path), bounds)
+    path.unlink()
+
+    assert first.url != second.url
+    m = folium.Map()
+    first.add_to(m)
+    second.add_to(m)
+    m.get_root().render()
+
+
+def test_image_overlay_checks_image_eagerly():
+    bounds = [[0, 0], [1, 1]]
+    with pytest.raises(FileNotFoundError):
+        folium.raster_layers.ImageOverlay("does_not_exist.png", bounds)
+    with pytest.raises(ValueError):
+        folium.raster_layers.ImageOverlay(
+            np.zeros((2, 2)), bounds, colormap=lambda x: (x, x)
+        )
+
+
+def test_image_overlay_bounds():
+    io = folium.raster_layers.ImageOverlay(
+        "https://example.com/image.png", np.array([[0, -180], [90, 180]])
+    )
+    assert io.bounds == [[0.0, -180.0], [90.0, 180.0]]
+
+
+@pytest.mark.parametrize(
+    "bounds",
+    [
+        [[0, -180], [90, "north"]],
+        [[0, 0]],
+        [[0, 0], [1, 1], [2, 2]],
+    ],
+)
+def test_overlay_invalid_bounds(bounds):
+    with pytest.raises(ValueError):
+        folium.raster_layers.ImageOverlay(
+            np.zeros((2, 2)), bounds, mercator_project=True
+        )
+    with pytest.raises(ValueError):
+        folium.raster_layers.VideoOverlay("https://example.com/video.mp4", bounds)
+
+
 def test_xyzservices():
     m = folium.Map([48.0, 5.0], tiles=xyzservices.providers.Stamen.Toner, zoom_start=6)
 
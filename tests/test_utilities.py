@@ -1,6 +1,10 @@
+import base64
+import warnings
+
 import numpy as np
 import pandas as pd
 import pytest
+from branca.utilities import write_png
 
 from folium import FeatureGroup, Map, Marker, Popup
 from folium.utilities import (
@@ -10,7 +14,9 @@ from folium.utilities import (
     escape_double_quotes,
     get_obj_in_upper_tree,
     if_pandas_df_convert_to_numpy,
+    image_to_url,
     javascript_identifier_path_to_array_notation,
+    mercator_transform,
     parse_options,
     validate_location,
     validate_locations,
@@ -216,3 +222,78 @@ def test_escape_double_quotes(text, result):
 )
 def test_javascript_identifier_path_to_array_notation(text, result):
     assert javascript_identifier_path_to_array_notation(text) == result
+
+
+def _mercator_data_with_nan():
+    data = np.arange(12, dtype=float).reshape((6, 2))
+    data[4, 0] = np.nan
+    return data
+
+
+@pytest.mark.parametrize(
+    "data, lat_bounds",
+    [
+        (np.random.default_rng(0).random((7, 5, 3)), (-80, 70)),
+        (_mercator_data_with_nan(), (10, 80)),
+    ],
+)
+@pytest.mark.parametrize("origin", ["upper", "lower"])
+@pytest.mark.parametrize("height_out", [None, 1, 13])
+def test_mercator_transform(data, lat_bounds, origin, height_out):
+    out = mercator_transform(data, lat_bounds, origin=origin, height_out=height_out)
+
+    # Reference: interpolate every column and layer separately.
+    def mercator(x):
+        return np.arcsinh(np.tan(x * np.pi / 180.0)) * 180.0 / np.pi
+
+    data = np.atleast_3d(data)
+    height, width, nblayers = data.shape
+    lat_min, lat_max = lat_bounds
+    height_out = height if height_out is None else height_out
+    array = data[::-1] if origin == "upper" else data
+    lats = lat_min + np.linspace(0.5 / height, 1.0 - 0.5 / height, height) * (
+        lat_max - lat_min
+    )
+    latslats = mercator(lat_min) + np.linspace(
+        0.5 / height_out, 1.0 - 0.5 / height_out, height_out
+    ) * (mercator(lat_max) - mercator(lat_min))
+    expected = np.zeros((height_out, width, nblayers))
+    for i in range(width):
+        for j in range(nblayers):
+            expected[:, i, j] = np.interp(latslats, mercator(lats), array[:, i, j])
+    if origin == "upper":
+        expected = expected[::-1]
+
+    np.testing.assert_allclose(out, expected)
+
+
+@pytest.mark.parametrize("origin", ["upper", "lower"])
+def test_mercator_transform_zero_height(origin):
+    data = np.arange(12, dtype=float).reshape((4, 3))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        out = mercator_transform(data, (30, 30), origin=origin, height_out=5)
+    expected_row = data[0] if origin == "upper" else data[-1]
+    np.testing.assert_array_equal(out[:, :, 0], np.tile(expected_row, (5, 1)))
+
+
+@pytest.mark.parametrize(
+    "colormap", [None, lambda x: (x, 0.5 * x, 0.25), lambda x: (x, x, 0, 0.5)]
+)
+@pytest.mark.parametrize(
+    "image",
+    [
+        np.random.default_rng(0).random((20, 30)),
+        np.random.default_rng(0).integers(0, 256, (10, 7)).astype("uint8"),
+        np.random.default_rng(0).random((5, 6, 3)),
+    ],
+)
+def test_image_to_url_array(image, colormap):
+    url = image_to_url(image, colormap=colormap)
+    png = write_png(image, colormap=colormap)
+    assert url == "data:image/png;base64," + base64.b64encode(png).decode("utf-8")
+
+
+def test_image_to_url_invalid_colormap():
+    with pytest.raises(ValueError):
+        image_to_url(np.zeros((2, 2)), colormap=lambda x: (x, x))